@@ -13,6 +13,9 @@ default_args = {
     'retry_delay': timedelta(minutes=5),
 }
 
+# Pool bounding the concurrent per-creator Avro writes (e.g. an `avro_writers` pool with N slots).
+AVRO_WRITERS_POOL = os.environ.get('VCS_AVRO_WRITERS_POOL', 'default_pool')
+
 with DAG(
     dag_id='video_creator_stats_dag',
     default_args=default_args,
@@ -30,21 +33,132 @@ with DAG(
 
     from airflow.decorators import task
 
-    @task(task_id='creator_stats')
-    def run_stats_task():
-        try:
-            # Import here to avoid top-level failures if paths aren't set yet during parsing
-            from process import main as process_main
-            
-            logging.info("Imported process successfully. Running main function...")
-            process_main()
-            logging.info("Process main function completed.")
-            
-        except ImportError as e:
-            logging.error(f"Failed to import process module. Sys path is: {sys.path}")
-            raise e
-        except Exception as e:
-            logging.error(f"Error executing stats process: {e}")
-            raise e
-    
-    run_stats_task()
+    # Tasks hand DataFrames to each other through pickle files in a per-run staging
+    # directory on the shared data volume; XCom only carries the file paths.
+    # Heavy imports stay inside the tasks to keep DAG parsing fast.
+
+    def staging_path(run_id, name):
+        from process import default_paths
+        data_dir, _, _ = default_paths()
+        staging_dir = os.path.join(data_dir, 'staging', run_id)
+        os.makedirs(staging_dir, exist_ok=True)
+        return os.path.join(staging_dir, f"{name}.pkl")
+
+    def load_csv(name, qa_pipeline, csv_path, run_id):
+        from utils import IngestionFile
+        out_path = staging_path(run_id, f"{name}_raw")
+        IngestionFile(qa_pipeline, csv_path, 0).load_data().to_pickle(out_path)
+        return out_path
+
+    def run_qa(name, qa_pipeline, csv_path, raw_path, run_id):
+        import pandas as pd
+        from utils import IngestionFile
+        ingestion = IngestionFile(qa_pipeline, csv_path, 0)
+        ingestion.data = pd.read_pickle(raw_path)
+        out_path = staging_path(run_id, name)
+        ingestion.clean_data().to_pickle(out_path)
+        return out_path
+
+    def stats_from_staging(creators_path, videos_path):
+        import pandas as pd
+        from process import VideoCreatorStats, default_paths
+        _, creators_csv, videos_csv = default_paths()
+        stats = VideoCreatorStats(creators_csv, videos_csv)
+        stats.creators = pd.read_pickle(creators_path)
+        stats.videos = pd.read_pickle(videos_path)
+        return stats
+
+    @task
+    def load_creators(run_id=None):
+        from config import creator_qa_pipeline
+        from process import default_paths
+        _, creators_csv, _ = default_paths()
+        return load_csv('creators', creator_qa_pipeline, creators_csv, run_id)
+
+    @task
+    def load_videos(run_id=None):
+        from config import videos_qa_pipeline
+        from process import default_paths
+        _, _, videos_csv = default_paths()
+        return load_csv('videos', videos_qa_pipeline, videos_csv, run_id)
+
+    @task
+    def qa_creators(raw_path, run_id=None):
+        from config import creator_qa_pipeline
+        from process import default_paths
+        _, creators_csv, _ = default_paths()
+        return run_qa('creators', creator_qa_pipeline, creators_csv, raw_path, run_id)
+
+    @task
+    def qa_videos(raw_path, run_id=None):
+        from config import videos_qa_pipeline
+        from process import default_paths
+        _, _, videos_csv = default_paths()
+        return run_qa('videos', videos_qa_pipeline, videos_csv, raw_path, run_id)
+
+    @task
+    def merge(creators_path, videos_path, run_id=None):
+        stats = stats_from_staging(creators_path, videos_path)
+        stats.process_data()
+        out_path = staging_path(run_id, 'merged')
+        stats.merged.to_pickle(out_path)
+        return out_path
+
+    @task(multiple_outputs=True)
+    def creator_stats(creators_path, videos_path, merged_path, run_id=None):
+        import pandas as pd
+        stats = stats_from_staging(creators_path, videos_path)
+        stats.merged = pd.read_pickle(merged_path)
+        stats.generate_creator_stats_table()
+        out_path = staging_path(run_id, 'creator_stats')
+        stats.stats_table.to_pickle(out_path)
+        # Every file of the run is named after the date stamped on the stats rows.
+        return {'path': out_path, 'run_date': stats.run_at.strftime('%Y-%m-%d')}
+
+    @task
+    def write_avro(creators_path, stats_path, run_date):
+        import pandas as pd
+        from process import STATS_SCHEMA_OVERRIDES, avro_output_path, default_paths
+        from Storage.AvroStorage import AvroPandasStorage
+        data_dir, _, _ = default_paths()
+        stats_file = avro_output_path(data_dir, 'creator_stats', run_date)
+        AvroPandasStorage(stats_file, pd.read_pickle(stats_path), schema_overrides=STATS_SCHEMA_OVERRIDES).save()
+        creators_file = avro_output_path(data_dir, 'creators', run_date)
+        AvroPandasStorage(creators_file, pd.read_pickle(creators_path)).save()
+
+    @task
+    def partition_videos(videos_path, run_id=None):
+        import pandas as pd
+        from process import partition_frame
+        partitions = []
+        for creator_id, group in partition_frame(pd.read_pickle(videos_path), 'creator_id'):
+            out_path = staging_path(run_id, f"videos_creator_id={creator_id}")
+            group.to_pickle(out_path)
+            partitions.append({'creator_id': int(creator_id), 'path': out_path})
+        return partitions
+
+    @task(pool=AVRO_WRITERS_POOL)
+    def write_videos(partition, run_date):
+        import pandas as pd
+        from process import avro_output_path, default_paths
+        from Storage.AvroStorage import AvroPandasStorage
+        data_dir, _, _ = default_paths()
+        v_file = avro_output_path(data_dir, 'videos', run_date, creator_id=partition['creator_id'])
+        AvroPandasStorage(v_file, pd.read_pickle(partition['path'])).save()
+
+    @task(trigger_rule='all_done')
+    def cleanup_staging(run_id=None):
+        import shutil
+        from process import default_paths
+        data_dir, _, _ = default_paths()
+        shutil.rmtree(os.path.join(data_dir, 'staging', run_id), ignore_errors=True)
+
+    creators = qa_creators(load_creators())
+    videos = qa_videos(load_videos())
+    merged = merge(creators, videos)
+    stats = creator_stats(creators, videos, merged)
+    written = [
+        write_avro(creators, stats['path'], stats['run_date']),
+        write_videos.partial(run_date=stats['run_date']).expand(partition=partition_videos(videos))
+    ]
+    written >> cleanup_staging()
@@ -1,6 +1,37 @@
 import pandas as pd
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
+
+
+def _top_n_indices(scores, top_n):
+    """
+    Return the positions of the top_n highest scores, ordered by descending score.
+
+    Equal scores keep their positional order, exactly as a full stable sort would.
+    A partial partition finds the n-th highest score, and only the candidates scoring
+    at least that much are sorted.
+    """
+    if top_n <= 0 or scores.size == 0:
+        return np.empty(0, dtype=np.intp)
+    if scores.size > top_n:
+        nth_score = -np.partition(-scores, top_n - 1)[top_n - 1]
+        candidates = np.flatnonzero(scores >= nth_score)
+    else:
+        candidates = np.arange(scores.size)
+    return candidates[np.argsort(-scores[candidates], kind='stable')[:top_n]]
+
+
+def _top_keywords_per_row(matrix, feature_names, top_n):
+    """
+    Yield the top_n keywords for each row of a CSR matrix.
+
+    Reads the CSR buffers directly instead of indexing the matrix per element.
+    """
+    indptr, indices, data = matrix.indptr, matrix.indices, matrix.data
+    for i in range(matrix.shape[0]):
+        lo, hi = indptr[i], indptr[i + 1]
+        top_idx = _top_n_indices(data[lo:hi], top_n)
+        yield feature_names[indices[lo:hi][top_idx]].tolist()
+
 
 class TextStatistics:
     """
@@ -9,7 +40,29 @@ class TextStatistics:
     def __init__(self):
         pass
 
-    def extract_keywords_per_item(self, captions, ids, top_n=3):
+    def fit_tfidf(self, text_series):
+        """
+        Fit the shared TF-IDF configuration on a series of text.
+
+        Args:
+            text_series (pd.Series): Text data to vectorize. Missing values are treated as empty.
+
+        Returns:
+            tuple: (CSR TF-IDF matrix, feature names), or (None, None) when there is
+            no text or no vocabulary left after stop words.
+        """
+        if text_series.empty:
+            return None, None
+
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        tfidf = TfidfVectorizer(stop_words='english')
+        try:
+            tfidf_matrix = tfidf.fit_transform(text_series.fillna(''))
+        except ValueError:
+            return None, None
+        return tfidf_matrix.tocsr(), tfidf.get_feature_names_out()
+
+    def extract_keywords_per_item(self, captions, ids, top_n=3, tfidf=None):
         """
         Helper method to extract top keywords using TF-IDF.
 
@@ -17,35 +70,101 @@ class TextStatistics:
             captions (pd.Series): Series of caption text.
             ids (pd.Series): Series of identifiers corresponding to captions.
             top_n (int): Number of top keywords to return per item.
+            tfidf (tuple, optional): Result of fit_tfidf(captions), to reuse an existing fit.
 
         Returns:
             dict: Mapping of id to list of keywords.
         """
-        if captions.empty:
+        tfidf_matrix, feature_names = tfidf if tfidf is not None else self.fit_tfidf(captions)
+        if tfidf_matrix is None:
             return {}
 
-        tfidf = TfidfVectorizer(stop_words='english')
-        try:
-            tfidf_matrix = tfidf.fit_transform(captions)
-        except ValueError:
+        keywords = _top_keywords_per_row(tfidf_matrix, feature_names, top_n)
+        return dict(zip(ids, keywords))
+
+    def get_top_keywords_per_group(self, text_series, groups, top_n=3, tfidf=None):
+        """
+        Extract top keywords for each group of texts (e.g., all captions per creator).
+
+        TF-IDF is fitted once over the whole series, and per-group scores are summed
+        in a single sparse product between a group indicator matrix and the TF-IDF matrix.
+
+        Args:
+            text_series (pd.Series): Text data to analyze.
+            groups (pd.Series): Group key for each text, aligned with text_series.
+            top_n (int): Number of top keywords to extract per group.
+            tfidf (tuple, optional): Result of fit_tfidf(text_series), to reuse an existing fit.
+
+        Returns:
+            dict: Mapping of group key to list of top keywords.
+        """
+        tfidf_matrix, feature_names = tfidf if tfidf is not None else self.fit_tfidf(text_series)
+        if tfidf_matrix is None:
             return {}
-            
-        feature_names = tfidf.get_feature_names_out()
-        results = {}
-        
-        for i in range(len(captions)):
-            id_val = ids.iloc[i]
-            row = tfidf_matrix[i]
-            _, col_indices = row.nonzero()
-            
-            word_scores = []
-            for col_idx in col_indices:
-                word_scores.append((feature_names[col_idx], row[0, col_idx]))
-            
-            word_scores.sort(key=lambda x: x[1], reverse=True)
-            results[id_val] = [w for w, s in word_scores[:top_n]]
-            
-        return results
+
+        from scipy import sparse
+        codes, uniques = pd.factorize(groups)
+        n_docs = len(codes)
+        indicator = sparse.csr_matrix(
+            (np.ones(n_docs), (codes, np.arange(n_docs))),
+            shape=(len(uniques), n_docs)
+        )
+        group_scores = (indicator @ tfidf_matrix).tocsr()
+        # The product's column order is arbitrary; sort it so tied scores resolve in feature order.
+        group_scores.sort_indices()
+        keywords = _top_keywords_per_row(group_scores, feature_names, top_n)
+        return dict(zip(uniques, keywords))
+
+    def get_trending_keywords_for_series(self, text_series, top_n=5, n_features=2**18):
+        """
+        Extract top trending keywords across a series of text without building a vocabulary.
+
+        Terms are hashed into a fixed number of buckets and weighted with TF-IDF. Only the
+        winning buckets are mapped back to a token, using a document that contains them.
+
+        Args:
+            text_series (pd.Series): Text data to analyze.
+            top_n (int): Number of top keywords to extract.
+            n_features (int): Number of hash buckets.
+
+        Returns:
+            list: List of top keywords.
+        """
+        if text_series.empty:
+            return []
+
+        from sklearn.feature_extraction import FeatureHasher
+        from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+        texts = text_series.fillna('')
+        hasher = HashingVectorizer(stop_words='english', n_features=n_features, alternate_sign=False, norm=None)
+        counts = hasher.transform(texts)
+        scores = np.asarray(TfidfTransformer().fit_transform(counts).sum(axis=0)).ravel()
+        # Bucket sums accumulate in a different order than vocabulary column sums; round off
+        # the last bits so mathematically equal scores tie and fall through to the keyword order.
+        scores = scores.round(12)
+
+        top_buckets = _top_n_indices(scores, top_n)
+        top_buckets = top_buckets[scores[top_buckets] > 0]
+        if top_buckets.size == 0:
+            return []
+        # Bucket positions say nothing about vocabulary order, so name every bucket tied
+        # with the last pick and break ties by keyword, as a sort over the vocabulary would.
+        top_buckets = np.flatnonzero(scores >= scores[top_buckets[-1]])
+
+        # Tokenize one sample document per winning bucket in a single vectorized pass,
+        # mirroring the hasher's lowercasing, token pattern and stop words.
+        docs_by_bucket = counts.tocsc()
+        sample_docs = texts.iloc[docs_by_bucket.indices[docs_by_bucket.indptr[top_buckets]]]
+        tokens = sample_docs.str.lower().str.findall(hasher.token_pattern).explode().dropna()
+        tokens = tokens[~tokens.isin(hasher.get_stop_words())].drop_duplicates().to_numpy()
+
+        # Same hashing HashingVectorizer applies to each token, used to resolve bucket names.
+        token_hasher = FeatureHasher(n_features=n_features, input_type='string', alternate_sign=False)
+        token_buckets = token_hasher.transform(tokens[:, None]).indices
+        names = pd.Series(tokens, index=token_buckets)
+        names = names[~names.index.duplicated()].reindex(top_buckets).to_numpy()
+        order = np.lexsort((names, -scores[top_buckets]))[:top_n]
+        return names[order].tolist()
 
     def get_top_keywords_for_series(self, text_series, top_n=3):
         """
@@ -58,18 +177,9 @@ class TextStatistics:
         Returns:
             list: List of top keywords.
         """
-        combined_text = " ".join(text_series.fillna('').astype(str))
-        if not combined_text.strip():
+        matrix, feature_names = self.fit_tfidf(text_series)
+        if matrix is None:
             return []
-            
-        tfidf = TfidfVectorizer(stop_words='english')
-        try:
-            matrix = tfidf.fit_transform(text_series.fillna(''))
-            scores = np.asarray(matrix.sum(axis=0)).flatten()
-            feature_names = tfidf.get_feature_names_out()
-            
-            word_scores = list(zip(feature_names, scores))
-            word_scores.sort(key=lambda x: x[1], reverse=True)
-            return [w for w, s in word_scores[:top_n]]
-        except ValueError:
-            return []
\ No newline at end of file
+
+        scores = np.asarray(matrix.sum(axis=0)).ravel()
+        return feature_names[_top_n_indices(scores, top_n)].tolist()
\ No newline at end of file
@@ -1,27 +1,38 @@
 from .BaseStorage import BaseStorage
-import fastavro
+import functools
+import json
+import numpy as np
 import pandas as pd
 
+def _first_valid(values):
+    """ Returns the first non-missing value, stopping at the first hit instead of scanning the column. """
+    return next((v for v in values if v is not None and v is not pd.NA and not (isinstance(v, float) and v != v)), None)
+
+@functools.lru_cache(maxsize=64)
+def _parsed_schema(schema_json):
+    """ Parses each distinct schema once per process; parsed schemas are only read, so sharing is safe. """
+    import fastavro
+    return fastavro.parse_schema(json.loads(schema_json))
+
 class AvroPandasStorage(BaseStorage):
-    def __init__(self, path: str, data: pd.DataFrame):
+    def __init__(self, path: str, data: pd.DataFrame, schema_overrides: dict = None):
         super().__init__()
         self.path = path
         self.data = data
+        self.schema_overrides = schema_overrides
     
-    def save(self):
+    @classmethod
+    def build_schema(cls, df: pd.DataFrame, schema_overrides: dict = None) -> dict:
         """
-        Helper method to save a pandas DataFrame to an Avro file.
-        Infers schema from DataFrame dtypes.
+        Infer an Avro record schema from DataFrame dtypes.
 
         Args:
-            df (pd.DataFrame): DataFrame to save.
-            path (str): Destination file path.
+            df (pd.DataFrame): DataFrame to inspect.
+            schema_overrides (dict, optional): Avro types for known columns, skipping inference.
+
+        Returns:
+            dict: Avro schema definition.
         """
-        df = self.data
-        df_clean = df.where(pd.notnull(df), None)
-        
-        records = df_clean.to_dict('records')
-        
         schema = {
             'doc': 'Auto generated schema',
             'name': 'Data',
@@ -30,7 +41,11 @@ class AvroPandasStorage(BaseStorage):
             'fields': []
         }
         
+        schema_overrides = schema_overrides or {}
         for col, dtype in df.dtypes.items():
+            if col in schema_overrides:
+                schema['fields'].append({'name': col, 'type': schema_overrides[col]})
+                continue
             avro_type = 'string'
             dtype_str = str(dtype).lower()
             if 'int' in dtype_str:
@@ -41,15 +56,75 @@ class AvroPandasStorage(BaseStorage):
                 avro_type = ['null', 'boolean']
             elif 'datetime' in dtype_str:
                 avro_type = ['null', {'type': 'long', 'logicalType': 'timestamp-micros'}]
+            elif dtype_str == 'category':
+                avro_type = ['null', 'string']
             elif 'object' in str(dtype):
-                val = df_clean[col].dropna().iloc[0] if not df_clean[col].dropna().empty else None
+                val = _first_valid(df[col].to_numpy())
                 if isinstance(val, list):
                     avro_type = {'type': 'array', 'items': 'string'}
                 else:
                     avro_type = ['null', 'string']
             
             schema['fields'].append({'name': col, 'type': avro_type})
-            
+        return schema
+
+    @classmethod
+    def parsed_schema(cls, df: pd.DataFrame, schema_overrides: dict = None) -> dict:
+        """
+        Infer the Avro schema for a DataFrame and return it parsed.
+        Parsed schemas are cached by their definition, so repeated writes of the
+        same shape (partitions, later DAG runs in the same worker) skip parsing.
+
+        Args:
+            df (pd.DataFrame): DataFrame to inspect.
+            schema_overrides (dict, optional): Avro types for known columns, skipping inference.
+
+        Returns:
+            dict: Schema returned by fastavro.parse_schema.
+        """
+        schema = cls.build_schema(df, schema_overrides)
+        return _parsed_schema(json.dumps(schema, sort_keys=True))
+
+    def save(self):
+        """
+        Helper method to save a pandas DataFrame to an Avro file.
+        Infers schema from DataFrame dtypes.
+        """
+        self.save_with_schema(self.parsed_schema(self.data, self.schema_overrides))
+
+    def save_with_schema(self, parsed_schema: dict):
+        """
+        Save the DataFrame using an already parsed Avro schema, skipping inference.
+        Useful when writing many partitions that share one schema.
+
+        Args:
+            parsed_schema (dict): Schema returned by fastavro.parse_schema.
+        """
+        import fastavro
         with open(self.path, 'wb') as out:
-            fastavro.writer(out, schema, records)
-        
\ No newline at end of file
+            fastavro.writer(out, parsed_schema, self.records())
+
+    def records(self):
+        """
+        Yield one Avro record per DataFrame row, with missing values as None.
+
+        Numeric columns are read from their native arrays; only NaN floats are
+        replaced per row. Other columns are converted once with NA mapped to None.
+        """
+        df = self.data
+        cols = tuple(df.columns)
+        arrays = []
+        for col in cols:
+            dtype = df[col].dtype
+            if isinstance(dtype, np.dtype) and dtype.kind in 'iuf':
+                arrays.append(df[col].to_numpy())
+            else:
+                arrays.append(df[col].to_numpy(dtype=object, na_value=None))
+        float_cols = [i for i, values in enumerate(arrays) if values.dtype.kind == 'f']
+        
+        for row in zip(*arrays):
+            record = dict(zip(cols, row))
+            for i in float_cols:
+                if row[i] != row[i]:
+                    record[cols[i]] = None
+            yield record
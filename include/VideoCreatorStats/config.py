@@ -2,7 +2,19 @@
 
     This is used to validate the data before processing it. Note each definition,
     must have a col key, and a type key, in an order preserving manner relative to the file.
+    Conditions receive the whole DataFrame and should use vectorized column checks.
 """
+import pandas as pd
+
+
+def to_category(series):
+    """ Stores a low-cardinality text column as a categorical, so joins and group-bys compare integer codes. """
+    return series.astype("category")
+
+
+def downcast_count(series):
+    """ Narrows a filled count column to the smallest integer dtype holding its values, cutting memory traffic in reductions. """
+    return pd.to_numeric(series.astype("int64"), downcast="integer")
 
 
 """ QA Pipeline for creators.csv """
@@ -13,12 +25,12 @@ creator_qa_pipeline = [
         "warnings": [
             {
                 "message": "Creator ID is not an integer.",
-                "condition": lambda df: df["creator_id"].apply(lambda x: not isinstance(x, int)).any() 
+                "condition": lambda df: not pd.api.types.is_integer_dtype(df["creator_id"])
             }
         ],
         "assertions": [
             {
-                "condition": lambda df: df["creator_id"].apply(lambda x: x < 0).any(),
+                "condition": lambda df: (df["creator_id"] < 0).any(),
                 "message": "Creator ID cannot be negative",
                 "should_fail": True
             }
@@ -30,14 +42,15 @@ creator_qa_pipeline = [
         "assertions": [
             {
                 "message": "Username is not a string.",
-                "condition": lambda df: df["username"].apply(lambda x: not isinstance(x, str)).any()
+                "condition": lambda df: not pd.api.types.is_string_dtype(df["username"])
             },
             {
-                "condition": lambda df: df["username"].apply(lambda x: x == "").any(),
+                "condition": lambda df: (df["username"] == "").any(),
                 "message": "Username cannot be empty",
                 "should_fail": True
             }
-        ]
+        ],
+        "post_processing": [to_category]
     },
     {
         "col": 'follower_count',
@@ -46,12 +59,12 @@ creator_qa_pipeline = [
         "warnings": [
             {
                 "message": "Follower count is not an integer.",
-                "condition": lambda df: df["follower_count"].apply(lambda x: not isinstance(x, int)).any()
+                "condition": lambda df: not pd.api.types.is_integer_dtype(df["follower_count"])
             }
         ],
         "assertions": [
             {
-                "condition": lambda df: df["follower_count"].apply(lambda x: x < 0).any(),
+                "condition": lambda df: (df["follower_count"] < 0).any(),
                 "message": "Follower count cannot be negative",
                 "should_fail": True
             }
@@ -64,12 +77,12 @@ creator_qa_pipeline = [
         "warnings": [
             {
                 "message": "Average views is not an integer.",
-                "condition": lambda df: df["avg_views"].apply(lambda x: not isinstance(x, int)).any()
+                "condition": lambda df: not pd.api.types.is_integer_dtype(df["avg_views"])
             }
         ],
         "assertions": [
             {
-                "condition": lambda df: df["avg_views"].apply(lambda x: x < 0).any(),
+                "condition": lambda df: (df["avg_views"] < 0).any(),
                 "message": "Average views cannot be negative",
                 "should_fail": True
             }
@@ -82,9 +95,10 @@ creator_qa_pipeline = [
         "assertions": [
             {
                 "message": "Category is not a string.",
-                "condition": lambda df: df["category"].apply(lambda x: not isinstance(x, str)).any()
+                "condition": lambda df: not pd.api.types.is_string_dtype(df["category"])
             }
-        ]
+        ],
+        "post_processing": [to_category]
     },
     {
         "col": 'bio',
@@ -93,7 +107,7 @@ creator_qa_pipeline = [
         "assertions": [
             {
                 "message": "Bio is not a string.",
-                "condition": lambda df: df["bio"].apply(lambda x: not isinstance(x, str)).any()
+                "condition": lambda df: not pd.api.types.is_string_dtype(df["bio"])
             }
         ]
     }
@@ -107,7 +121,7 @@ videos_qa_pipeline = [
         "type": str,
         "assertions": [
             {
-                "condition": lambda df: df["video_id"].apply(lambda x: not isinstance(x, str)).any(),
+                "condition": lambda df: not pd.api.types.is_string_dtype(df["video_id"]),
                 "message": "Video ID is not a string.",
                 "should_fail": True
             }
@@ -119,12 +133,12 @@ videos_qa_pipeline = [
         "warnings": [
             {
                 "message": "Creator ID is not an integer.",
-                "condition": lambda df: df["creator_id"].apply(lambda x: not isinstance(x, int)).any()
+                "condition": lambda df: not pd.api.types.is_integer_dtype(df["creator_id"])
             }
         ],
         "assertions": [
             {
-                "condition": lambda df: df["creator_id"].apply(lambda x: x < 0).any(),
+                "condition": lambda df: (df["creator_id"] < 0).any(),
                 "message": "Creator ID cannot be negative",
                 "should_fail": True
             }
@@ -137,16 +151,17 @@ videos_qa_pipeline = [
         "warnings": [
             {
                 "message": "Views is not an integer.",
-                "condition": lambda df: df["views"].apply(lambda x: not isinstance(x, int)).any()
+                "condition": lambda df: not pd.api.types.is_integer_dtype(df["views"])
             }
         ],
         "assertions": [
             {
-                "condition": lambda df: df["views"].apply(lambda x: x < 0).any(),
+                "condition": lambda df: (df["views"] < 0).any(),
                 "message": "Views cannot be negative",
                 "should_fail": True
             }
-        ]
+        ],
+        "post_processing": [downcast_count]
     },
     {
         "col": 'likes',
@@ -155,16 +170,17 @@ videos_qa_pipeline = [
         "warnings": [
             {
                 "message": "Likes is not an integer.",
-                "condition": lambda df: df["likes"].apply(lambda x: not isinstance(x, int)).any()
+                "condition": lambda df: not pd.api.types.is_integer_dtype(df["likes"])
             }
         ],
         "assertions": [
             {
-                "condition": lambda df: df["likes"].apply(lambda x: x < 0).any(),
+                "condition": lambda df: (df["likes"] < 0).any(),
                 "message": "Likes cannot be negative",
                 "should_fail": True
             }
-        ]
+        ],
+        "post_processing": [downcast_count]
     },
     {
         "col": 'comments',
@@ -173,16 +189,17 @@ videos_qa_pipeline = [
         "warnings": [
             {
                 "message": "Comments is not an integer.",
-                "condition": lambda df: df["comments"].apply(lambda x: not isinstance(x, int)).any()
+                "condition": lambda df: not pd.api.types.is_integer_dtype(df["comments"])
             }
         ],
         "assertions": [
             {
-                "condition": lambda df: df["comments"].apply(lambda x: x < 0).any(),
+                "condition": lambda df: (df["comments"] < 0).any(),
                 "message": "Comments cannot be negative",
                 "should_fail": True
             }
-        ]
+        ],
+        "post_processing": [downcast_count]
     },
     {
         "col": 'shares',
@@ -191,16 +208,17 @@ videos_qa_pipeline = [
         "warnings": [
             {
                 "message": "Shares is not an integer.",
-                "condition": lambda df: df["shares"].apply(lambda x: not isinstance(x, int)).any()
+                "condition": lambda df: not pd.api.types.is_integer_dtype(df["shares"])
             }
         ],
         "assertions": [
             {
-                "condition": lambda df: df["shares"].apply(lambda x: x < 0).any(),
+                "condition": lambda df: (df["shares"] < 0).any(),
                 "message": "Shares cannot be negative",
                 "should_fail": True
             }
-        ]
+        ],
+        "post_processing": [downcast_count]
     },
     {
         "col": 'caption',
@@ -209,7 +227,7 @@ videos_qa_pipeline = [
         "assertions": [
             {
                 "message": "Caption is not a string.",
-                "condition": lambda df: df["caption"].apply(lambda x: not isinstance(x, str)).any()
+                "condition": lambda df: not pd.api.types.is_string_dtype(df["caption"])
             }
         ]
     }
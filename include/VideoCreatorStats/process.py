@@ -25,13 +25,19 @@ import logging
 import pandas as pd
 import numpy as np
 import os
-import fastavro
+import importlib.util
 from DataAnalytics.TextStatistics import TextStatistics
 from datetime import datetime
 from config import creator_qa_pipeline, videos_qa_pipeline
-from utils import IngestionFile
+from utils import IngestionFile, fast_io_enabled
 from Storage.AvroStorage import AvroPandasStorage
 
+# Avro types for stats columns that cannot be inferred from their dtype.
+STATS_SCHEMA_OVERRIDES = {'top_keywords': {'type': 'array', 'items': 'string'}}
+
+# Below this many rows numexpr's thread start-up costs more than the numpy temporaries it saves.
+NUMEXPR_MIN_ROWS = 100_000
+
 class VideoCreatorStats:
     """
     Class to calculate statistics for video creators based on CSV data inputs.
@@ -46,12 +52,46 @@ class VideoCreatorStats:
         """
         self.creators_path = creators_path
         self.videos_path = videos_path
-        self.creators = None
-        self.videos = None
+        self._creators = None
+        self._videos = None
         self.merged = None
+        self.creators_by_id = None
+        self.caption_tfidf = None
         self.stats_table = None
+        self.run_at = None
         self.text_stats = TextStatistics()
 
+    @property
+    def creators(self):
+        """ Cleaned creators DataFrame. """
+        return self._creators
+
+    @creators.setter
+    def creators(self, df):
+        self._creators = df
+        self._invalidate()
+
+    @property
+    def videos(self):
+        """ Cleaned videos DataFrame. """
+        return self._videos
+
+    @videos.setter
+    def videos(self, df):
+        self._videos = df
+        self._invalidate()
+
+    def _invalidate(self):
+        """
+        Drop everything derived from the input frames. The merge and the stats are
+        computed once and reused by every stats method until creators or videos is
+        reassigned, at which point they are rebuilt on next use.
+        """
+        self.merged = None
+        self.creators_by_id = None
+        self.caption_tfidf = None
+        self.stats_table = None
+
     def load_data(self):
         """
         Load creator and video data from CSV files using IngestionFile wrapper.
@@ -69,17 +109,33 @@ class VideoCreatorStats:
         """
         if self.creators is None or self.videos is None:
             self.load_data()
+        self.caption_tfidf = None
             
-        merged_all = pd.merge(self.videos, self.creators, on='creator_id', how='left', indicator=True, suffixes=('', '_creator'))
-        
-        unmatched_videos = merged_all[merged_all['_merge'] == 'left_only']
-        unmatched_count = len(unmatched_videos)
+        # Count unmatched videos with a hash-set lookup instead of materializing a left join.
+        unmatched_count = int((~self.videos['creator_id'].isin(self.creators['creator_id'])).sum())
         
         if unmatched_count > 0:
-            import logging
             logging.warning(f"Found {unmatched_count} videos with unmatched creator_id")
             
-        self.merged = merged_all[merged_all['_merge'] == 'both'].drop(columns=['_merge'])
+        # Index creators once; joining against the index skips building a hash table per merge.
+        self.creators_by_id = self.creators.set_index('creator_id')
+        if len(self.videos) == 0 or len(self.creators) == 0:
+            # Nothing can match: keep the merged columns without running the join over full data.
+            self.merged = self.videos.iloc[:0].join(self.creators_by_id.iloc[:0], on='creator_id', rsuffix='_creator')
+            return
+        self.merged = self.videos.join(self.creators_by_id, on='creator_id', how='inner', rsuffix='_creator')
+        
+        # Narrow the columns the aggregations scan repeatedly to cut memory traffic. The QA
+        # pipelines already narrow the counts and categorize category at load, so only
+        # columns that are still 64-bit (e.g. injected frames, creator profile fields) are converted.
+        for col in ['views', 'likes', 'comments', 'shares', 'avg_views', 'follower_count']:
+            if col in self.merged.columns and self.merged[col].dtype.itemsize > 4:
+                self.merged[col] = pd.to_numeric(self.merged[col], downcast='unsigned')
+        if 'category' in self.merged.columns and not isinstance(self.merged['category'].dtype, pd.CategoricalDtype):
+            self.merged['category'] = self.merged['category'].astype('category')
+        if fast_io_enabled() and 'caption' in self.merged.columns:
+            # Keep captions in one contiguous Arrow buffer instead of a Python object per row.
+            self.merged['caption'] = self.merged['caption'].astype('string[pyarrow]')
 
     def get_average_views_total(self):
         """
@@ -92,7 +148,13 @@ class VideoCreatorStats:
             self.process_data()
         if 'views' not in self.merged.columns:
              raise ValueError("Column 'views' not found in merged data")
-        return self.merged['views'].mean()
+        # A single ndarray reduction; missing views are skipped as Series.mean would.
+        views = self.merged['views']
+        if views.hasnans:
+            views = views.dropna()
+        if views.empty:
+            return np.nan
+        return float(views.to_numpy(dtype=np.float64).mean())
 
     def get_average_views_by_creator(self):
         """
@@ -114,7 +176,18 @@ class VideoCreatorStats:
         """
         if self.merged is None:
              self.process_data()
-        return self.merged.groupby('category')['views'].sum()
+        # Factorize once and sum with a bincount kernel instead of a full groupby.
+        codes, categories = pd.factorize(self.merged['category'], sort=True)
+        views = self.merged['views']
+        valid = codes >= 0
+        sums = np.bincount(
+            codes[valid],
+            weights=views.to_numpy(dtype=np.float64, na_value=0)[valid],
+            minlength=len(categories)
+        )
+        if pd.api.types.is_integer_dtype(views):
+            sums = sums.astype(np.int64)
+        return pd.Series(sums, index=pd.Index(categories, name='category'), name='views')
 
     def get_trending_keywords(self, top_n=5):
         """
@@ -129,8 +202,22 @@ class VideoCreatorStats:
         if self.merged is None:
             self.process_data()
         
-        return self.text_stats.get_top_keywords_for_series(self.merged['caption'], top_n)
+        return self.text_stats.get_trending_keywords_for_series(self.merged['caption'], top_n)
+
 
+    def get_caption_tfidf(self):
+        """
+        TF-IDF fit of the merged captions, computed once and shared by the
+        per-video and per-creator keyword extraction.
+
+        Returns:
+            tuple: (CSR TF-IDF matrix, feature names), or (None, None) if there is no vocabulary.
+        """
+        if self.merged is None:
+            self.process_data()
+        if self.caption_tfidf is None:
+            self.caption_tfidf = self.text_stats.fit_tfidf(self.merged['caption'])
+        return self.caption_tfidf
 
     def get_top_keywords_by_video(self, top_n=3):
         """
@@ -145,8 +232,9 @@ class VideoCreatorStats:
         if self.merged is None:
             self.process_data()
         
-        captions = self.merged['caption'].fillna('')
-        return self.text_stats.extract_keywords_per_item(captions, self.merged['video_id'], top_n)
+        return self.text_stats.extract_keywords_per_item(
+            self.merged['caption'], self.merged['video_id'], top_n, tfidf=self.get_caption_tfidf()
+        )
 
 
 
@@ -161,49 +249,59 @@ class VideoCreatorStats:
         if self.merged is None:
             self.process_data()
 
-        creators_grp = self.merged.groupby('creator_id')
+        keywords_by_creator = self.text_stats.get_top_keywords_per_group(
+            self.merged['caption'], self.merged['creator_id'], top_n=3, tfidf=self.get_caption_tfidf()
+        )
         
-        stats_list = []
+        # Fuse likes, comments and shares into one engagement column, then aggregate
+        # all creators in a single groupby pass.
+        engagement = engagement_counts(self.merged)
+        stats = self.merged[['creator_id', 'views']].assign(engagement=engagement).groupby('creator_id').agg(
+            total_views=('views', 'sum'),
+            avg_views=('views', 'mean'),
+            engagement=('engagement', 'sum')
+        )
         
-        for creator_id, group in creators_grp:
-            creator_info = self.creators[self.creators['creator_id'] == creator_id].iloc[0]
-            
-            username = creator_info['username']
-            follower_count = creator_info['follower_count']
-            top_category = creator_info['category']
-            
-            total_views = group['views'].sum()
-            total_engagement = group['likes'].sum() + group['comments'].sum() + group['shares'].sum()
-            
-            avg_views = group['views'].mean()
-            avg_engagement = total_engagement / total_views if total_views > 0 else 0
-            
-            virality_score = np.log(total_engagement / follower_count) if follower_count > 0 else 0
-            
-            top_keywords = self.text_stats.get_top_keywords_for_series(group['caption'], top_n=3)
+        # Both frames are keyed by creator_id, so attach profile fields with an index join.
+        if self.creators_by_id is None:
+            self.creators_by_id = self.creators.set_index('creator_id')
+        creators_by_id = self.creators_by_id[~self.creators_by_id.index.duplicated()]
+        creators_by_id = creators_by_id[['username', 'follower_count', 'category']].rename(columns={'category': 'top_category'})
+        stats = stats.join(creators_by_id).reset_index()
         
-            today_str = datetime.now().strftime('%Y-%m-%d')
-            updated_at = datetime.now()
-            
-            creator_stats = {
-                'creator_id': creator_id,
-                'timestamp': today_str,
-                'username': username,
-                'follower_count': follower_count,
-                'avg_views': avg_views,
-                'top_category': top_category,
-                'avg_engagement': avg_engagement,
-                'virality_score': virality_score,
-                'top_keywords': top_keywords,
-                'updated_at': updated_at
-            }
-            
-            top_keywords_str = ",".join(top_keywords)
-            
-            logging.info(f"Creator stats: {creator_id}|{username}|{follower_count}|{avg_views}|{avg_engagement}|{virality_score}|{top_category}|{top_keywords_str}")
-            stats_list.append(creator_stats)
+        total_views = stats['total_views'].to_numpy(dtype=float)
+        total_engagement = stats['engagement'].to_numpy(dtype=float)
+        follower_count = stats['follower_count'].to_numpy(dtype=float, na_value=np.nan)
+        
+        # Divide and log only where the denominator is positive; other rows keep the 0 in `out`.
+        has_views = total_views > 0
+        has_followers = follower_count > 0
+        stats['avg_engagement'] = np.divide(
+            total_engagement, total_views, out=np.zeros_like(total_engagement), where=has_views
+        )
+        reach = np.divide(total_engagement, follower_count, out=np.zeros_like(total_engagement), where=has_followers)
+        with np.errstate(divide='ignore'):
+            stats['virality_score'] = np.log(reach, out=reach, where=has_followers)
+        
+        stats['top_keywords'] = [keywords_by_creator.get(creator_id, []) for creator_id in stats['creator_id']]
+        
+        # Read the clock once per run; both columns broadcast the scalar, and save_data reuses it.
+        self.run_at = datetime.now()
+        stats['timestamp'] = self.run_at.strftime('%Y-%m-%d')
+        stats['updated_at'] = self.run_at
+        
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            for row in stats.itertuples(index=False):
+                logging.info(
+                    "Creator stats: %s|%s|%s|%s|%s|%s|%s|%s",
+                    row.creator_id, row.username, row.follower_count, row.avg_views,
+                    row.avg_engagement, row.virality_score, row.top_category, ",".join(row.top_keywords)
+                )
             
-        self.stats_table = pd.DataFrame(stats_list)
+        self.stats_table = stats[[
+            'creator_id', 'timestamp', 'username', 'follower_count', 'avg_views',
+            'top_category', 'avg_engagement', 'virality_score', 'top_keywords', 'updated_at'
+        ]]
         return self.stats_table
 
     def save_data(self, output_dir):
@@ -216,28 +314,23 @@ class VideoCreatorStats:
         if self.stats_table is None:
             self.generate_creator_stats_table()
             
-        today_str = datetime.now().strftime('%Y-%m-%d')
+        # Name the files after the run that built the stats table, matching its timestamp column.
+        today_str = (self.run_at or datetime.now()).strftime('%Y-%m-%d')
         
-        stats_dir = os.path.join(output_dir, 'creator_stats')
-        os.makedirs(stats_dir, exist_ok=True)
-        stats_file = os.path.join(stats_dir, f"{today_str}.avro")
-        AvroPandasStorage(stats_file, self.stats_table).save()
+        stats_file = avro_output_path(output_dir, 'creator_stats', today_str)
+        AvroPandasStorage(stats_file, self.stats_table, schema_overrides=STATS_SCHEMA_OVERRIDES).save()
         
-        creators_out_dir = os.path.join(output_dir, 'creators')
-        os.makedirs(creators_out_dir, exist_ok=True)
-        creators_file = os.path.join(creators_out_dir, f"{today_str}.avro")
+        creators_file = avro_output_path(output_dir, 'creators', today_str)
         AvroPandasStorage(creators_file, self.creators).save()
         
-        videos_base_dir = os.path.join(output_dir, 'videos')
-        
         if self.videos is None:
             self.load_data()
             
-        for creator_id, group in self.videos.groupby('creator_id'):
-            c_dir = os.path.join(videos_base_dir, f"creator_id={creator_id}")
-            os.makedirs(c_dir, exist_ok=True)
-            v_file = os.path.join(c_dir, f"{today_str}.avro")
-            AvroPandasStorage(v_file, group).save()
+        # All partitions share the videos schema, so infer and parse it once.
+        videos_schema = AvroPandasStorage.parsed_schema(self.videos)
+        for creator_id, group in partition_frame(self.videos, 'creator_id'):
+            v_file = avro_output_path(output_dir, 'videos', today_str, creator_id=creator_id)
+            AvroPandasStorage(v_file, group).save_with_schema(videos_schema)
 
     def generate_stats(self):
         """
@@ -263,16 +356,89 @@ class VideoCreatorStats:
             "creator_stats_table": self.stats_table
         }
 
-import sys
+def engagement_counts(df):
+    """
+    Row-wise likes + comments + shares as int64, wide enough for the downcast count columns.
+    On large frames the additions run through numexpr when it is installed, as one
+    fused multithreaded pass instead of a numpy temporary per operator.
 
-def main():
-    
+    Args:
+        df (pd.DataFrame): Frame with likes, comments and shares columns. Missing counts add 0.
+
+    Returns:
+        np.ndarray: Engagement per row.
+    """
+    counts = {col: df[col].to_numpy(dtype=np.int64, na_value=0) for col in ('likes', 'comments', 'shares')}
+    if len(df) >= NUMEXPR_MIN_ROWS and importlib.util.find_spec('numexpr') is not None:
+        import numexpr
+        return numexpr.evaluate('likes + comments + shares', local_dict=counts)
+    return counts['likes'] + counts['comments'] + counts['shares']
+
+def partition_frame(df, col):
+    """
+    Split a DataFrame into one slice per distinct value of a column.
+    Rows are sorted by the partition key once, and every partition is a contiguous
+    slice of that sorted frame rather than a separate per-group copy. Rows with a
+    missing key are dropped, as with groupby.
+
+    Args:
+        df (pd.DataFrame): DataFrame to partition.
+        col (str): Partition column.
+
+    Yields:
+        tuple: (key, pd.DataFrame) in ascending key order.
+    """
+    codes, keys = pd.factorize(df[col], sort=True)
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    order = order[sorted_codes >= 0]
+    sorted_codes = sorted_codes[sorted_codes >= 0]
+    sorted_df = df.iloc[order]
+    bounds = np.flatnonzero(np.diff(sorted_codes)) + 1
+    starts = np.concatenate(([0], bounds))
+    ends = np.concatenate((bounds, [len(sorted_codes)]))
+    for start, end in zip(starts, ends):
+        if end > start:
+            yield keys[sorted_codes[start]], sorted_df.iloc[start:end]
+
+def avro_output_path(output_dir, dataset, today_str, creator_id=None):
+    """
+    Build the Avro file path for an output dataset, creating its directory.
+    Videos are Hive-style partitioned by creator_id.
+
+    Args:
+        output_dir (str): Root output directory.
+        dataset (str): Dataset name ('creator_stats', 'creators' or 'videos').
+        today_str (str): Date used as the file name (YYYY-MM-DD).
+        creator_id (int, optional): Partition key for the videos dataset.
+
+    Returns:
+        str: Path of the Avro file to write.
+    """
+    out_dir = os.path.join(output_dir, dataset)
+    if creator_id is not None:
+        out_dir = os.path.join(out_dir, f"creator_id={creator_id}")
+    os.makedirs(out_dir, exist_ok=True)
+    return os.path.join(out_dir, f"{today_str}.avro")
+
+def default_paths():
+    """
+    Resolve the project data directory and the input CSV paths within it.
+
+    Returns:
+        tuple: (data_dir, creators_path, videos_path)
+    """
     base_dir = os.path.dirname(os.path.abspath(__file__))
     root_dir = os.path.abspath(os.path.join(base_dir, '../../'))
     data_dir = os.path.join(root_dir, 'data')
     
     creators_path = os.path.join(data_dir, 'creators.csv')
     videos_path = os.path.join(data_dir, 'videos.csv')
+    return data_dir, creators_path, videos_path
+
+def main():
+    
+    data_dir, creators_path, videos_path = default_paths()
     
     logging.info(f"Loading data from {data_dir}")
     
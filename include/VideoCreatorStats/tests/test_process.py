@@ -1,12 +1,21 @@
 import pytest
+import numpy as np
 import pandas as pd
 from VideoCreatorStats.process import VideoCreatorStats
 
-@pytest.fixture
-def mock_stats_obj(tmp_path):
+@pytest.fixture(scope="session")
+def base_stats_obj():
     # Put dummy paths, we will inject DFs directly
     return VideoCreatorStats("dummy_creators.csv", "dummy_videos.csv")
 
+@pytest.fixture
+def mock_stats_obj(base_stats_obj):
+    # Share one instance across tests; clearing the inputs also drops every derived result.
+    base_stats_obj.creators = None
+    base_stats_obj.videos = None
+    base_stats_obj.run_at = None
+    return base_stats_obj
+
 def test_process_data_failing(mock_stats_obj):
     """
     Test that is designed to fail as requested.
@@ -196,3 +205,177 @@ def test_full_stats_schema(mock_stats_obj):
     # Verify types of new fields
     assert isinstance(df.iloc[0]['timestamp'], str)
     assert isinstance(df.iloc[0]['updated_at'], datetime)
+
+def test_creator_top_keywords(mock_stats_obj):
+    creators_data = {
+        'creator_id': [1, 2],
+        'username': ['u1', 'u2'],
+        'follower_count': [100, 100],
+        'avg_views': [0, 0],
+        'category': ['Tech', 'Food'],
+        'bio': ['', '']
+    }
+    videos_data = {
+        'video_id': [101, 102, 103],
+        'creator_id': [1, 1, 2],
+        'views': [100, 100, 100],
+        'likes': [1, 1, 1],
+        'comments': [0, 0, 0],
+        'shares': [0, 0, 0],
+        'caption': ['python tips', 'python tricks', 'pasta recipe']
+    }
+
+    mock_stats_obj.creators = pd.DataFrame(creators_data)
+    mock_stats_obj.videos = pd.DataFrame(videos_data)
+
+    df = mock_stats_obj.generate_creator_stats_table().set_index('creator_id')
+
+    assert df.loc[1, 'top_keywords'][0] == 'python'
+    assert set(df.loc[2, 'top_keywords']) == {'pasta', 'recipe'}
+
+def test_creator_engagement_metrics(mock_stats_obj):
+    creators_data = {
+        'creator_id': [1, 2],
+        'username': ['u1', 'u2'],
+        'follower_count': [100, 0],
+        'avg_views': [0, 0],
+        'category': ['Tech', 'Food'],
+        'bio': ['', '']
+    }
+    videos_data = {
+        'video_id': [101, 102, 103],
+        'creator_id': [1, 1, 2],
+        'views': [100, 300, 0],
+        'likes': [10, 20, 5],
+        'comments': [5, 0, 0],
+        'shares': [5, 0, 0],
+        'caption': ['a', 'b', 'c']
+    }
+
+    mock_stats_obj.creators = pd.DataFrame(creators_data)
+    mock_stats_obj.videos = pd.DataFrame(videos_data)
+
+    df = mock_stats_obj.generate_creator_stats_table().set_index('creator_id')
+
+    assert df.loc[1, 'avg_views'] == 200
+    assert df.loc[1, 'avg_engagement'] == pytest.approx(40 / 400)
+    assert df.loc[1, 'virality_score'] == pytest.approx(np.log(40 / 100))
+    assert df.loc[1, 'top_category'] == 'Tech'
+    assert df.loc[2, 'avg_engagement'] == 0
+    assert df.loc[2, 'virality_score'] == 0
+
+def test_save_data(mock_stats_obj, tmp_path):
+    creators_data = {
+        'creator_id': [1, 2],
+        'username': ['u1', 'u2'],
+        'follower_count': [100, 200],
+        'avg_views': [0, 0],
+        'category': ['Tech', 'Food'],
+        'bio': ['', '']
+    }
+    videos_data = {
+        'video_id': ['v1', 'v2', 'v3'],
+        'creator_id': [1, 1, 2],
+        'views': [100, 200, 300],
+        'likes': [1, 2, 3],
+        'comments': [0, 0, 0],
+        'shares': [0, 0, 0],
+        'caption': ['python tips', 'python tricks', 'pasta recipe']
+    }
+
+    mock_stats_obj.creators = pd.DataFrame(creators_data)
+    mock_stats_obj.videos = pd.DataFrame(videos_data)
+
+    mock_stats_obj.save_data(str(tmp_path))
+
+    files = sorted(p.relative_to(tmp_path).parts[:-1] for p in tmp_path.rglob('*.avro'))
+    assert files == [
+        ('creator_stats',), ('creators',),
+        ('videos', 'creator_id=1'), ('videos', 'creator_id=2')
+    ]
+    run_date = mock_stats_obj.stats_table['timestamp'].iloc[0]
+    assert {p.name for p in tmp_path.rglob('*.avro')} == {f"{run_date}.avro"}
+
+def test_partition_frame():
+    from VideoCreatorStats.process import partition_frame
+    df = pd.DataFrame({'creator_id': [2, 1, None, 2, 1], 'video_id': ['a', 'b', 'c', 'd', 'e']})
+
+    partitions = [(key, group['video_id'].tolist()) for key, group in partition_frame(df, 'creator_id')]
+
+    assert partitions == [(1, ['b', 'e']), (2, ['a', 'd'])]
+
+def test_process_data_no_creators(mock_stats_obj):
+    mock_stats_obj.creators = pd.DataFrame({'creator_id': pd.Series([], dtype='int64'), 'username': pd.Series([], dtype=object)})
+    mock_stats_obj.videos = pd.DataFrame({'video_id': [101], 'creator_id': [1], 'views': [100], 'caption': ['a']})
+
+    mock_stats_obj.process_data()
+
+    assert len(mock_stats_obj.merged) == 0
+    assert 'username' in mock_stats_obj.merged.columns
+
+def test_caption_tfidf_fitted_once(mock_stats_obj, monkeypatch):
+    creators_data = {
+        'creator_id': [1],
+        'username': ['u1'],
+        'follower_count': [100],
+        'avg_views': [0],
+        'category': ['Tech'],
+        'bio': ['']
+    }
+    videos_data = {
+        'video_id': [101, 102],
+        'creator_id': [1, 1],
+        'views': [100, 100],
+        'likes': [1, 1],
+        'comments': [0, 0],
+        'shares': [0, 0],
+        'caption': ['python tips', 'python tricks']
+    }
+
+    mock_stats_obj.creators = pd.DataFrame(creators_data)
+    mock_stats_obj.videos = pd.DataFrame(videos_data)
+
+    fit_tfidf = mock_stats_obj.text_stats.fit_tfidf
+    calls = []
+    monkeypatch.setattr(mock_stats_obj.text_stats, 'fit_tfidf', lambda s: calls.append(s) or fit_tfidf(s))
+
+    mock_stats_obj.get_top_keywords_by_video()
+    mock_stats_obj.generate_creator_stats_table()
+
+    assert len(calls) == 1
+
+def test_merge_reused_until_inputs_change(mock_stats_obj, monkeypatch):
+    mock_stats_obj.creators = pd.DataFrame({'creator_id': [1], 'username': ['u1']})
+    mock_stats_obj.videos = pd.DataFrame({
+        'video_id': ['v1', 'v2'], 'creator_id': [1, 1], 'views': [100, 200],
+        'category': ['Tech', 'Tech'], 'caption': ['a', 'b']
+    })
+    merges = []
+    process_data = VideoCreatorStats.process_data
+    monkeypatch.setattr(VideoCreatorStats, 'process_data', lambda self: merges.append(1) or process_data(self))
+
+    assert mock_stats_obj.get_average_views_total() == 150
+    assert mock_stats_obj.get_views_per_category()['Tech'] == 300
+    assert len(merges) == 1
+
+    mock_stats_obj.videos = mock_stats_obj.videos.assign(views=[300, 500])
+
+    assert mock_stats_obj.get_average_views_total() == 400
+    assert len(merges) == 2
+
+@pytest.mark.parametrize("use_numexpr", [False, True])
+def test_engagement_counts(monkeypatch, use_numexpr):
+    from VideoCreatorStats import process
+    if use_numexpr:
+        pytest.importorskip("numexpr")
+        monkeypatch.setattr(process, 'NUMEXPR_MIN_ROWS', 0)
+    df = pd.DataFrame({
+        'likes': np.array([120, 100], dtype='int8'),
+        'comments': pd.array([10, None], dtype='Int64'),
+        'shares': np.array([30000, 1], dtype='int16')
+    })
+
+    engagement = process.engagement_counts(df)
+
+    assert engagement.dtype == np.int64
+    assert engagement.tolist() == [30130, 101]
@@ -0,0 +1,65 @@
+import fastavro
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from VideoCreatorStats.Storage.AvroStorage import AvroPandasStorage
+
+def read_avro(path):
+    with open(path, 'rb') as f:
+        return list(fastavro.reader(f))
+
+def test_avro_round_trip(tmp_path):
+    df = pd.DataFrame({
+        'creator_id': [1, 2],
+        'username': ['u1', None],
+        'avg_views': [1.5, np.nan],
+        'top_keywords': [['a', 'b'], []],
+        'updated_at': [datetime(2025, 1, 1), datetime(2025, 1, 2)]
+    })
+    path = str(tmp_path / "data.avro")
+
+    AvroPandasStorage(path, df).save()
+    records = read_avro(path)
+
+    assert [r['creator_id'] for r in records] == [1, 2]
+    assert [r['username'] for r in records] == ['u1', None]
+    assert [r['avg_views'] for r in records] == [1.5, None]
+    assert [r['top_keywords'] for r in records] == [['a', 'b'], []]
+    assert records[1]['updated_at'].replace(tzinfo=None) == datetime(2025, 1, 2)
+
+def test_save_with_shared_schema(tmp_path):
+    df = pd.DataFrame({'creator_id': [1, 1, 2], 'views': [10, 20, 30]})
+    schema = AvroPandasStorage.parsed_schema(df)
+    assert AvroPandasStorage.parsed_schema(df.iloc[:1]) is schema
+
+    for creator_id, group in df.groupby('creator_id'):
+        AvroPandasStorage(str(tmp_path / f"{creator_id}.avro"), group).save_with_schema(schema)
+
+    assert [r['views'] for r in read_avro(str(tmp_path / "1.avro"))] == [10, 20]
+    assert [r['views'] for r in read_avro(str(tmp_path / "2.avro"))] == [30]
+
+def test_category_column(tmp_path):
+    df = pd.DataFrame({'category': pd.Series(['Tech', None, 'Tech'], dtype='category')})
+    path = str(tmp_path / "data.avro")
+
+    AvroPandasStorage(path, df).save()
+
+    assert [r['category'] for r in read_avro(path)] == ['Tech', None, 'Tech']
+
+def test_schema_overrides(tmp_path):
+    # An empty first list would otherwise be inferred as a string column.
+    df = pd.DataFrame({'top_keywords': [None, ['a']]})
+    schema = AvroPandasStorage.build_schema(df, {'top_keywords': {'type': 'array', 'items': 'string'}})
+
+    assert schema['fields'] == [{'name': 'top_keywords', 'type': {'type': 'array', 'items': 'string'}}]
+
+def test_nullable_and_bool_columns(tmp_path):
+    df = pd.DataFrame({
+        'views': pd.array([1, None], dtype='Int64'),
+        'active': [True, False]
+    })
+    path = str(tmp_path / "data.avro")
+
+    AvroPandasStorage(path, df).save()
+
+    assert read_avro(path) == [{'views': 1, 'active': True}, {'views': None, 'active': False}]
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+from VideoCreatorStats.DataAnalytics.TextStatistics import TextStatistics, _top_n_indices
+
+def test_top_keywords_for_series():
+    captions = pd.Series(['python python tips', 'python tricks', 'pasta recipe'])
+
+    keywords = TextStatistics().get_top_keywords_for_series(captions, top_n=2)
+
+    assert keywords[0] == 'python'
+    assert len(keywords) == 2
+
+def test_top_keywords_for_series_empty():
+    assert TextStatistics().get_top_keywords_for_series(pd.Series([], dtype=object)) == []
+
+def test_top_n_indices_ties_keep_position_order():
+    scores = np.array([1.0, 2.0, 0.5, 2.0, 2.0, 2.0, 0.0])
+
+    assert _top_n_indices(scores, 3).tolist() == [1, 3, 4]
+    assert _top_n_indices(scores, 10).tolist() == [1, 3, 4, 5, 0, 2, 6]
+
+def test_keywords_per_item_ties_match_full_sort():
+    rng = np.random.default_rng(0)
+    captions = pd.Series([' '.join(f'w{i}' for i in rng.integers(0, 300, 8)) for _ in range(500)])
+    text_stats = TextStatistics()
+    matrix, feature_names = text_stats.fit_tfidf(captions)
+
+    expected = {}
+    for i in range(matrix.shape[0]):
+        row = matrix[i]
+        ranked = sorted(zip(row.indices, row.data), key=lambda item: -item[1])
+        expected[i] = [feature_names[col] for col, _ in ranked[:3]]
+
+    assert text_stats.extract_keywords_per_item(captions, pd.Series(range(len(captions)))) == expected
+
+def test_group_keywords_ties_follow_feature_order():
+    captions = pd.Series(['delta alpha', 'charlie bravo', 'echo'])
+    groups = pd.Series([7, 7, 8])
+
+    keywords = TextStatistics().get_top_keywords_per_group(captions, groups, top_n=3)
+
+    assert keywords[7] == ['alpha', 'bravo', 'charlie']
+
+def test_trending_keywords_ties_follow_keyword_order():
+    captions = pd.Series(['delta alpha', 'charlie bravo', 'echo foxtrot'])
+
+    assert TextStatistics().get_trending_keywords_for_series(captions, top_n=3) == ['alpha', 'bravo', 'charlie']
@@ -0,0 +1,119 @@
+import pytest
+import pandas as pd
+from VideoCreatorStats.utils import IngestionFile
+from VideoCreatorStats.config import creator_qa_pipeline, videos_qa_pipeline
+
+def write_csv(path, header, rows):
+    path.write_text("\n".join([header] + rows) + "\n")
+    return str(path)
+
+def test_clean_creators(tmp_path):
+    filename = write_csv(
+        tmp_path / "creators.csv",
+        "creator_id,username,follower_count,avg_views,category,bio",
+        ["1,user1,100,50,Tech,", "2,user2,,10,,Bio"]
+    )
+    df = IngestionFile(creator_qa_pipeline, filename, 0).clean_data()
+
+    assert len(df) == 2
+    assert df['follower_count'].tolist() == [100, 0]
+    assert df['category'].tolist() == ['Tech', '']
+    assert df['bio'].tolist() == ['', 'Bio']
+    assert isinstance(df['category'].dtype, pd.CategoricalDtype)
+    assert isinstance(df['username'].dtype, pd.CategoricalDtype)
+
+def test_negative_views_fail(tmp_path):
+    filename = write_csv(
+        tmp_path / "videos.csv",
+        "video_id,creator_id,views,likes,comments,shares,caption",
+        ["v1,1,100,1,1,1,hello", "v2,1,-5,1,1,1,world"]
+    )
+    with pytest.raises(ValueError, match="Views cannot be negative"):
+        IngestionFile(videos_qa_pipeline, filename, 0).clean_data()
+
+def test_fast_io_matches_default(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    filename = write_csv(
+        tmp_path / "videos.csv",
+        "video_id,creator_id,views,likes,comments,shares,caption",
+        ["v1,1,100,1,2,3,hello", "v2,2,,1,1,1,"]
+    )
+    expected = IngestionFile(videos_qa_pipeline, filename, 0).clean_data()
+
+    monkeypatch.setenv("VCS_FAST_IO", "1")
+    df = IngestionFile(videos_qa_pipeline, filename, 0).clean_data()
+
+    pd.testing.assert_frame_equal(df, expected)
+
+def test_missing_required_value_fails(tmp_path):
+    filename = write_csv(
+        tmp_path / "videos.csv",
+        "video_id,creator_id,views,likes,comments,shares,caption",
+        ["v1,1,100,1,1,1,hello", "v2,,5,1,1,1,world"]
+    )
+    with pytest.raises(ValueError, match="Column creator_id contains null values"):
+        IngestionFile(videos_qa_pipeline, filename, 0).clean_data()
+
+def test_parquet_cache_reused(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    filename = write_csv(
+        tmp_path / "videos.csv",
+        "video_id,creator_id,views,likes,comments,shares,caption",
+        ["v1,1,100,1,2,3,hello", "v2,2,,1,1,1,"]
+    )
+    expected = IngestionFile(videos_qa_pipeline, filename, 0).clean_data()
+
+    monkeypatch.setenv("VCS_PARQUET_CACHE", "1")
+    IngestionFile(videos_qa_pipeline, filename, 0).load_data()
+    assert len(list(tmp_path.glob("videos.csv.*.parquet"))) == 1
+    assert not list(tmp_path.glob("*.tmp"))
+
+    def fail_read_csv(*args, **kwargs):
+        raise AssertionError("CSV parsed despite a fresh cache")
+    monkeypatch.setattr(pd, "read_csv", fail_read_csv)
+    df = IngestionFile(videos_qa_pipeline, filename, 0).clean_data()
+
+    pd.testing.assert_frame_equal(df, expected)
+
+@pytest.mark.parametrize("fast_io", ["0", "1"])
+def test_unlisted_columns_skipped(tmp_path, monkeypatch, fast_io):
+    if fast_io == "1":
+        pytest.importorskip("pyarrow")
+    monkeypatch.setenv("VCS_FAST_IO", fast_io)
+    filename = write_csv(
+        tmp_path / "videos.csv",
+        "video_id,creator_id,views,likes,comments,shares,caption,thumbnail_url",
+        ["v1,1,100,1,2,3,hello,http://example.com/v1.png"]
+    )
+    df = IngestionFile(videos_qa_pipeline, filename, 0).clean_data()
+
+    assert list(df.columns) == [qa['col'] for qa in videos_qa_pipeline]
+
+def test_counts_downcast(tmp_path):
+    filename = write_csv(
+        tmp_path / "videos.csv",
+        "video_id,creator_id,views,likes,comments,shares,caption",
+        ["v1,1,100000,100,1,,hello", "v2,1,5,120,1,1,world"]
+    )
+    df = IngestionFile(videos_qa_pipeline, filename, 0).clean_data()
+
+    assert df['views'].dtype == 'int32'
+    assert df['likes'].dtype == 'int8'
+    assert df['shares'].tolist() == [0, 1]
+
+def test_parquet_cache_ignored_after_pipeline_change(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setenv("VCS_PARQUET_CACHE", "1")
+    filename = write_csv(
+        tmp_path / "videos.csv",
+        "video_id,creator_id,views",
+        ["v1,1,100", "v2,2,"]
+    )
+    narrow_pipeline = [{'col': 'video_id', 'type': str}, {'col': 'creator_id', 'type': "Int64"}]
+    IngestionFile(narrow_pipeline, filename, 0).clean_data()
+
+    wide_pipeline = narrow_pipeline + [{'col': 'views', 'type': "Int64", 'fill_na': 0}]
+    df = IngestionFile(wide_pipeline, filename, 0).clean_data()
+
+    assert list(df.columns) == ['video_id', 'creator_id', 'views']
+    assert df['views'].tolist() == [100, 0]
@@ -1,5 +1,21 @@
 import pandas as pd 
+import hashlib
+import importlib.util
 import logging
+import os
+import tempfile
+
+def fast_io_enabled():
+    """ Returns True when the optional pyarrow CSV reader is requested (VCS_FAST_IO=1) and installed. """
+    return os.environ.get("VCS_FAST_IO") == "1" and importlib.util.find_spec("pyarrow") is not None
+
+def parquet_cache_enabled():
+    """ Returns True when parsed CSVs should be cached as parquet (VCS_PARQUET_CACHE=1) and pyarrow is installed. """
+    return os.environ.get("VCS_PARQUET_CACHE") == "1" and importlib.util.find_spec("pyarrow") is not None
+
+def _never_null(dtype):
+    """ True for non-nullable numpy integer dtypes, which have no missing-value representation. """
+    return pd.api.types.is_integer_dtype(dtype) and not pd.api.types.is_extension_array_dtype(dtype)
 
 class IngestionFile:
     """ Wrapper class for ingesting and cleaning a file.
@@ -15,9 +31,63 @@ class IngestionFile:
         self.header_types = {qa['col']: qa['type'] for qa in qa_pipeline}
         self.data = None
         
+    @property
+    def cache_path(self):
+        """ Parquet copy of the parsed file, stored next to it and named after how it was parsed. """
+        return f"{self.filename}.{self._parse_fingerprint()}.parquet"
+
+    def _parse_fingerprint(self):
+        """ Short hash of everything that shapes the parsed frame: columns and types, header row and reader. """
+        columns = [(col, getattr(col_type, '__name__', str(col_type))) for col, col_type in self.header_types.items()]
+        key = repr((columns, self.header_rows, fast_io_enabled()))
+        return hashlib.sha1(key.encode()).hexdigest()[:12]
+
     def load_data(self):
-        """ Loads the data from the file. """
-        self.data = pd.read_csv(self.filename, header=self.header_rows, dtype=self.header_types)
+        """ Loads the data from the file, or from its parquet cache when enabled and newer than the file. """
+        use_cache = parquet_cache_enabled()
+        if use_cache and self._cache_is_fresh():
+            self.data = pd.read_parquet(self.cache_path)
+            return self.data
+        self._read_csv()
+        if use_cache:
+            self._write_cache()
+        return self.data
+
+    def _cache_is_fresh(self):
+        return (os.path.exists(self.cache_path)
+                and os.path.getmtime(self.cache_path) >= os.path.getmtime(self.filename))
+
+    def _write_cache(self):
+        """ Writes the parquet cache through a temporary file, so concurrent loads never read a partial cache. """
+        cache_path = self.cache_path
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or ".",
+                                            prefix=f"{os.path.basename(cache_path)}.", suffix=".tmp")
+            os.close(fd)
+            self.data.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logging.warning(f"{self.filename} - Could not write parquet cache: {e}")
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _read_csv(self):
+        """ Parses the CSV. Uses the multithreaded pyarrow parser when fast IO is enabled. """
+        if fast_io_enabled():
+            # The pyarrow engine writes missing values as "<NA>" when casting to str, so text
+            # columns are read as nullable strings and converted back to object afterwards.
+            text_cols = [col for col, col_type in self.header_types.items() if col_type is str]
+            dtypes = {col: "string" if col in text_cols else col_type for col, col_type in self.header_types.items()}
+            df = pd.read_csv(self.filename, header=self.header_rows, dtype=dtypes, usecols=list(self.header_types),
+                             engine="pyarrow", dtype_backend="numpy_nullable")
+            df[text_cols] = df[text_cols].astype(object)
+            self.data = df
+        else:
+            # Only the columns named in the QA pipeline are parsed; any others are skipped by the tokenizer.
+            self.data = pd.read_csv(self.filename, header=self.header_rows, dtype=self.header_types,
+                                    usecols=list(self.header_types))
         return self.data
 
     def clean_data(self):
@@ -26,16 +96,25 @@ class IngestionFile:
             self.load_data()
         df = self.data
         filename = self.filename
+
+        # NA Handling, batched over all columns: one fillna call, then one null check
+        # across the columns that have no fill value.
+        fill_map = {qa['col']: qa['fill_na'] for qa in self.qa_pipeline if "fill_na" in qa}
+        if fill_map:
+            df.fillna(fill_map, inplace=True)
+        # Plain numpy integer columns cannot hold missing values, so they are not scanned.
+        required_cols = [qa['col'] for qa in self.qa_pipeline
+                         if "fill_na" not in qa and not _never_null(df[qa['col']].dtype)]
+        if required_cols:
+            null_cols = df[required_cols].isna().any()
+            if null_cols.any():
+                # Error if there are any na values.
+                col = null_cols.index[null_cols.to_numpy()][0]
+                logging.error(f"{filename} - Column {col} contains null values.")
+                raise ValueError(f"{filename} - Column {col} contains null values.")
+
         for qa in self.qa_pipeline:
             col = qa['col']
-            
-            # NA Handling
-            if "fill_na" in qa:
-                df[col] = df[col].fillna(qa['fill_na'])
-            else:
-                # Error if there are any na values.
-                if df[col].isnull().any():
-                    raise logging.error(f"{filename} - Column {col} contains null values.")
 
             # Warnings
             if "warnings" in qa: